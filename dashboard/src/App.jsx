@@ -11,6 +11,9 @@ function App() {
   const [activeCampaignCount, setActiveCampaignCount] = useState(activeCampaigns.length);
   const [agentCount, setAgentCount] = useState(agents.length);
 
+  // Single timestamp shared by the header clock and the footer
+  const now = new Date();
+
   // Stats for dashboard
   const frontOfficeCount = agents.filter(a => a.filter === 'front').length;
   const middleOfficeCount = agents.filter(a => a.filter === 'middle').length;
@@ -37,7 +40,7 @@ function App() {
         <h1>Koya Command Center</h1>
         <div className="header-controls">
           <div className="time-display">
-            {new Date().toLocaleDateString()} | {new Date().toLocaleTimeString()}
+            {now.toLocaleDateString()} | {now.toLocaleTimeString()}
           </div>
           <div className="user-controls">
             <span className="user-name">Vee (CEO)</span>
@@ -97,7 +100,7 @@ function App() {
             </div>
             <div className="dashboard-footer">
               <div className="system-status">System Status: <span className="status-normal">Normal</span></div>
-              <div className="update-time">Last updated: {new Date().toLocaleTimeString()}</div>
+              <div className="update-time">Last updated: {now.toLocaleTimeString()}</div>
             </div>
           </>
         )}
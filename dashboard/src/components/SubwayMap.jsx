@@ -152,6 +152,10 @@ const SubwayMap = () => {
     // Store simulation reference for controls
     simulationRef.current = simulation;
 
+    // Index nodes and lines by id so per-tick lookups don't scan the arrays
+    const nodeById = new Map(nodesData.map(n => [n.id, n]));
+    const lineById = new Map(workflowLines.map(l => [l.id, l]));
+
     // Draw connections (subway lines)
     const link = connectionsGroup.selectAll('.connection')
       .data(linksData)
@@ -268,8 +272,8 @@ const SubwayMap = () => {
       
       // Update connection paths
       link.attr('d', d => {
-        const sourceNode = nodesData.find(n => n.id === d.source);
-        const targetNode = nodesData.find(n => n.id === d.target);
+        const sourceNode = nodeById.get(d.source);
+        const targetNode = nodeById.get(d.target);
         
         if (!sourceNode || !targetNode) return '';
         
@@ -311,9 +315,9 @@ const SubwayMap = () => {
       
       // Draw active campaigns (trains)
       activeCampaigns.forEach(campaign => {
-        const line = workflowLines.find(l => l.id === campaign.lineId);
-        const currentStationNode = nodesData.find(n => n.id === campaign.currentStationId);
-        const nextStationNode = nodesData.find(n => n.id === campaign.nextStationId);
+        const line = lineById.get(campaign.lineId);
+        const currentStationNode = nodeById.get(campaign.currentStationId);
+        const nextStationNode = nodeById.get(campaign.nextStationId);
         
         if (!currentStationNode || !nextStationNode || !line) return;
         